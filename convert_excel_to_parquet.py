@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Convert the aircraft registry Excel file to Parquet
+Writes one cleaned Parquet file per sheet so the dashboard can skip Excel parsing
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+EXCEL_FILE = 'data/Stand_2025_10_DE.xlsx'
+CACHE_DIR = 'data/cache'
+EXCEL_ENGINE = 'calamine'  # Rust-based parser, much faster than openpyxl
+CACHE_VERSION = 10  # Bump whenever read_sheet or the cached chart data computations change
+
+# Columns used by the charts and summary; the data preview shows all of them
+NEEDED_COLS = ['Hersteller', 'Herstellerbezeichnung', 'höchstzulässige Abflugmasse (kg)']
+
+# Low-cardinality text columns stored as categoricals
+CATEGORICAL_COLS = ['Hersteller', 'Herstellerbezeichnung']
+
+
+def as_text(series):
+    """Convert values to strings, keeping missing values as NaN"""
+    # Whole numbers in a column with gaps are read as floats; write 172, not 172.0
+    if series.dtype.kind == 'f' and (series.dropna() % 1 == 0).all():
+        series = series.astype('Int64')
+    return series.astype(str).where(series.notna())
+
+
+def clean_sheet_data(df, downcast=False):
+    """Drop empty rows, make the mass column numeric, stringify mixed columns and categorize text keys
+
+    With downcast=True the mass column is stored as float32, which is plenty for
+    the charts; the preview keeps float64 so it shows the workbook's values.
+    """
+    df = df.dropna(how='all')  # Remove completely empty rows
+    df.columns = df.columns.astype(str)  # Parquet requires string column names
+
+    # Ensure mass column is numeric
+    if 'höchstzulässige Abflugmasse (kg)' in df.columns:
+        df['höchstzulässige Abflugmasse (kg)'] = pd.to_numeric(
+            df['höchstzulässige Abflugmasse (kg)'], errors='coerce', downcast='float' if downcast else None
+        )
+
+    # Columns mixing numbers and text (e.g. serials 17265432 and F-0001) can't be written to Parquet
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = as_text(df[col])
+
+    # Group-by keys compare as small integer codes instead of Python strings;
+    # as text first, so a model entered as 172 and as '172' is a single category
+    for col in CATEGORICAL_COLS:
+        if col in df.columns:
+            df[col] = as_text(df[col]).astype('category')
+
+    return df
+
+
+def add_group_column(df):
+    """Add the combined 'Hersteller - Herstellerbezeichnung' Group column as a categorical"""
+    if 'Hersteller' not in df.columns or 'Herstellerbezeichnung' not in df.columns:
+        return df
+
+    maker = df['Hersteller'].cat
+    model = df['Herstellerbezeichnung'].cat
+
+    # Missing values (code -1) wrap around to a trailing 'nan' label, like astype(str)
+    maker_labels = np.append(maker.categories.astype(str), 'nan')
+    model_labels = np.append(model.categories.astype(str), 'nan')
+    n_models = len(model_labels)
+
+    # Build labels only for the pairs that occur, then index them by pair code
+    pair_codes = (maker.codes.to_numpy(np.int64) % len(maker_labels)) * n_models \
+        + model.codes.to_numpy(np.int64) % n_models
+    pairs, inverse = np.unique(pair_codes, return_inverse=True)
+    labels = pd.Index([f'{maker_labels[p // n_models]} - {model_labels[p % n_models]}' for p in pairs])
+
+    # Different pairs can join to the same text ('A - B' + 'C' vs 'A' + 'B - C')
+    categories = labels.unique()
+    df['Group'] = pd.Categorical.from_codes(categories.get_indexer(labels)[inverse], categories=categories)
+    return df
+
+
+def column_names(header_row):
+    """Column names from a raw header row, filled and de-duplicated like read_excel"""
+    names = []
+    for i, name in enumerate(header_row):
+        name = f'Unnamed: {i}' if pd.isna(name) else str(name)
+        candidate, n = name, 0
+        while candidate in names:
+            n += 1
+            candidate = f'{name}.{n}'
+        names.append(candidate)
+    return names
+
+
+def read_sheet(xl, sheet_name):
+    """Parse a sheet once into its chart frame (NEEDED_COLS + Group) and full-width frame
+
+    Row 0 holds the sheet title, which is kept in attrs['title'] of both frames
+    (and so in their Parquet files); row 1 holds the column headers.
+    """
+    raw = pd.read_excel(xl, sheet_name=sheet_name, header=None, engine=EXCEL_ENGINE)
+    if len(raw) < 2:
+        raise ValueError(f"sheet {sheet_name!r} has no header row")
+
+    title = '' if pd.isna(raw.iat[0, 0]) else str(raw.iat[0, 0])
+    data = raw.iloc[2:].reset_index(drop=True).infer_objects()
+    data.columns = column_names(raw.iloc[1])
+
+    # The charts group by the combined key; the preview shows the sheet as is
+    chart_df = add_group_column(
+        clean_sheet_data(data[[col for col in data.columns if col in NEEDED_COLS]], downcast=True)
+    )
+    full_df = clean_sheet_data(data)
+
+    chart_df.attrs['title'] = full_df.attrs['title'] = title
+    return chart_df, full_df
+
+
+def parquet_path(sheet_name, cache_dir=CACHE_DIR, all_columns=False):
+    """Path of the cached Parquet file for a sheet"""
+    suffix = '.full' if all_columns else ''
+    return os.path.join(cache_dir, f'{sheet_name}{suffix}.v{CACHE_VERSION}.parquet')
+
+
+def excel_source(excel_file):
+    """Identity of an Excel file (path, mtime and size) that a cached sheet was built from"""
+    return {
+        'path': os.path.abspath(excel_file),
+        'mtime': os.path.getmtime(excel_file),
+        'size': os.path.getsize(excel_file)
+    }
+
+
+def read_sheet_cache(excel_file, sheet_name, cache_dir=CACHE_DIR, all_columns=False):
+    """Read a sheet from the Parquet cache, or None if missing or built from another Excel file"""
+    path = parquet_path(sheet_name, cache_dir, all_columns)
+    if not os.path.exists(path):
+        return None
+
+    df = pd.read_parquet(path)
+    if df.attrs.get('source') != excel_source(excel_file):
+        return None
+    return df
+
+
+def write_sheet_cache(df, excel_file, sheet_name, cache_dir=CACHE_DIR, all_columns=False):
+    """Write a cleaned sheet to the Parquet cache, tagged with the Excel file it came from"""
+    os.makedirs(cache_dir, exist_ok=True)
+    df = df.copy(deep=False)
+    df.attrs['source'] = excel_source(excel_file)  # Stored in the Parquet metadata
+
+    # Write to a temporary file and swap it in, so readers never see a partial file
+    path = parquet_path(sheet_name, cache_dir, all_columns)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def convert(excel_file=EXCEL_FILE, cache_dir=CACHE_DIR):
+    """Convert every sheet of the Excel file to Parquet (chart columns and full width)"""
+    with pd.ExcelFile(excel_file, engine=EXCEL_ENGINE) as xl:
+        for sheet_name in xl.sheet_names:
+            # One bad sheet shouldn't keep the others from being cached
+            try:
+                frames = read_sheet(xl, sheet_name)
+                for all_columns, df in zip((False, True), frames):
+                    write_sheet_cache(df, excel_file, sheet_name, cache_dir, all_columns)
+                    size_kb = df.memory_usage(deep=True).sum() / 1024
+                    print(f"{sheet_name}: {len(df):,} rows, {size_kb:,.0f} KiB -> "
+                          f"{parquet_path(sheet_name, cache_dir, all_columns)}")
+            except Exception as e:
+                print(f"{sheet_name}: failed - {e}")
+
+
+if __name__ == '__main__':
+    convert(*sys.argv[1:])
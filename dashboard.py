@@ -4,68 +4,265 @@ Interactive Dashboard for Aircraft Data Analysis
 Allows visualization of aircraft data from Excel file with multiple sheets
 """
 
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from dash import Dash, dcc, html, Input, Output, callback
+from scipy import signal
+from dash import Dash, dash_table, dcc, html, Input, Output, State, callback
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
 
-# Load data
-EXCEL_FILE = 'data/Stand_2025_10_DE.xlsx'
+from convert_excel_to_parquet import (
+    CACHE_DIR, CACHE_VERSION, EXCEL_ENGINE, EXCEL_FILE, read_sheet, read_sheet_cache,
+    write_sheet_cache
+)
 
 # Initialize the Dash app with Bootstrap theme
 app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 
-# Load Excel file and get sheet names
-xl = pd.ExcelFile(EXCEL_FILE)
-sheet_names = xl.sheet_names
+# Cache for expensive results, shared across sessions and worker processes;
+# switch CACHE_TYPE to 'RedisCache' (with CACHE_REDIS_URL) for production
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.cache',
+    'CACHE_DEFAULT_TIMEOUT': 3600
+})
+
+# Cached results are tied to the Excel file and the code version they were computed from
+DATA_VERSION = f"{os.path.abspath(EXCEL_FILE)}-{os.path.getmtime(EXCEL_FILE)}-v{CACHE_VERSION}"
+
+# Function to name memoized entries after the data they were computed from
+def versioned(name):
+    """Cache key prefix for a memoized function, so a new Excel file or CACHE_VERSION invalidates it"""
+    return f"{name}-{DATA_VERSION}"
 
 # Function to get descriptive label for sheets
-def get_sheet_label(sheet_name):
+def _extract_sheet_label(sheet_name, first_cell):
     """Extract descriptive text from first row for sheets 1.a through 6"""
     sheets_with_descriptions = ['1.a', '1.b', '2.', '3.', '4.', '5.', '6.']
 
-    if sheet_name in sheets_with_descriptions:
-        try:
-            df = pd.read_excel(xl, sheet_name=sheet_name, header=None, nrows=1)
-            first_cell = str(df.iloc[0, 0])
-
-            # Split by ' - ' and get the third segment (aircraft category)
-            if ' - ' in first_cell:
-                parts = first_cell.split(' - ')
-                if len(parts) >= 3:
-                    description = parts[2]  # Third segment contains the category
-                    return f"{sheet_name} - {description}"
-        except Exception as e:
-            print(f"Could not extract description for {sheet_name}: {e}")
+    if sheet_name in sheets_with_descriptions and first_cell:
+        # Split by ' - ' and get the third segment (aircraft category)
+        if ' - ' in first_cell:
+            parts = first_cell.split(' - ')
+            if len(parts) >= 3:
+                description = parts[2]  # Third segment contains the category
+                return f"{sheet_name} - {description}"
 
     return sheet_name  # Return original name if no description
 
-# Create sheet options for dropdown
-sheet_options = [{'label': get_sheet_label(sheet), 'value': sheet} for sheet in sheet_names]
-
-# Function to load data from a specific sheet
-def load_sheet_data(sheet_name):
-    """Load data from a specific sheet with proper header handling"""
+# Function to load a sheet, preferring the Parquet cache
+def _read_sheet(xl, sheet_name, all_columns=False):
+    """Load a single sheet from the Parquet cache, falling back to the Excel file (or path)"""
     try:
-        df = pd.read_excel(xl, sheet_name=sheet_name, header=1)
-        # Clean the data
-        df = df.dropna(how='all')  # Remove completely empty rows
-
-        # Ensure mass column is numeric
-        if 'höchstzulässige Abflugmasse (kg)' in df.columns:
-            df['höchstzulässige Abflugmasse (kg)'] = pd.to_numeric(
-                df['höchstzulässige Abflugmasse (kg)'], errors='coerce'
-            )
+        cached = read_sheet_cache(EXCEL_FILE, sheet_name, all_columns=all_columns)
+    except Exception as e:
+        # A damaged cache file is rebuilt from the Excel file below
+        print(f"Ignoring unreadable cache for sheet {sheet_name}: {e}")
+        cached = None
+    if cached is not None:
+        return cached
 
-        return df
+    try:
+        chart_df, full_df = read_sheet(xl, sheet_name)
     except Exception as e:
         print(f"Error loading sheet {sheet_name}: {e}")
         return pd.DataFrame()
 
+    # Cache both frames from the single parse, so neither the next start
+    # nor the data preview has to read the Excel file again
+    try:
+        write_sheet_cache(chart_df, EXCEL_FILE, sheet_name)
+        write_sheet_cache(full_df, EXCEL_FILE, sheet_name, all_columns=True)
+    except Exception as e:
+        print(f"Could not cache sheet {sheet_name}: {e}")
+
+    return full_df if all_columns else chart_df
+
+# Sheet dropdown options are cached next to the Parquet files, keyed on the Excel file
+SHEET_OPTIONS_FILE = os.path.join(CACHE_DIR, 'sheet_options.json')
+
+# Function to identify the Excel file the cached options were built from
+def _sheet_options_key():
+    """Cache key for the sheet options: Excel path, its mtime and the cache version"""
+    return [EXCEL_FILE, os.path.getmtime(EXCEL_FILE), CACHE_VERSION]
+
+# Function to read the cached sheet dropdown options
+def _load_cached_sheet_options():
+    """Cached sheet options, or None if missing or built from a different Excel file"""
+    try:
+        with open(SHEET_OPTIONS_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get('key') != _sheet_options_key():
+        return None
+    return cached.get('sheet_options')
+
+# Function to write the sheet dropdown options cache
+def _save_sheet_options(options):
+    """Persist sheet options so restarts (e.g. debug reloads) skip opening the Excel file"""
+    # Write to a temporary file and swap it in, so readers never see a partial file
+    tmp_path = f'{SHEET_OPTIONS_FILE}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': _sheet_options_key(), 'sheet_options': options}, f, ensure_ascii=False)
+        os.replace(tmp_path, SHEET_OPTIONS_FILE)
+    except OSError as e:
+        print(f"Could not cache sheet options: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Function to load everything the dashboard needs at startup
+def _load_all():
+    """Read chart data and sheet dropdown options, opening the Excel file only if needed"""
+    options = _load_cached_sheet_options()
+    if options is not None:
+        # Sheet names are known, so Excel is only opened for sheets with a stale Parquet cache
+        sheets = {option['value']: _read_sheet(EXCEL_FILE, option['value']) for option in options}
+        return sheets, options
+
+    with pd.ExcelFile(EXCEL_FILE, engine=EXCEL_ENGINE) as xl:
+        sheets = {sheet: _read_sheet(xl, sheet) for sheet in xl.sheet_names}
+
+    # Labels come from the title row stored alongside each parsed sheet
+    options = [{'label': _extract_sheet_label(sheet, df.attrs.get('title')), 'value': sheet}
+               for sheet, df in sheets.items()]
+    _save_sheet_options(options)
+    return sheets, options
+
+# Parse the chart columns of every sheet once at startup; callbacks only do dict lookups
+SHEETS, sheet_options = _load_all()
+sheet_names = list(SHEETS)
+SHEET_LABELS = {option['value']: option['label'] for option in sheet_options}
+
+# Function to get descriptive label for sheets
+def get_sheet_label(sheet_name):
+    """Descriptive label of a sheet, as extracted at startup"""
+    return SHEET_LABELS.get(sheet_name, sheet_name)
+
+# Function to load data from a specific sheet
+def load_sheet_data(sheet_name):
+    """Load data from a specific sheet"""
+    # Shallow copy so callers can add columns without touching the parsed frame
+    return SHEETS.get(sheet_name, pd.DataFrame()).copy(deep=False)
+
+# Function to load every column of a sheet for the data preview
+@lru_cache(maxsize=8)
+def load_preview_data(sheet_name):
+    """Load all columns of a sheet on first use (only the data preview needs them)"""
+    if sheet_name not in SHEETS:
+        return pd.DataFrame()
+    # Passing the path opens the Excel file only if the Parquet cache is stale
+    return _read_sheet(EXCEL_FILE, sheet_name, all_columns=True)
+
+# Function to restrict a sheet to the selected manufacturers
+def filter_by_manufacturers(df, manufacturers):
+    """Keep only rows whose Hersteller is one of the selected manufacturers"""
+    if manufacturers and 'Hersteller' in df.columns:
+        hersteller = df['Hersteller']
+        if isinstance(hersteller.dtype, pd.CategoricalDtype):
+            # Compare small integer codes instead of manufacturer strings
+            selected = hersteller.cat.categories.get_indexer(list(manufacturers))
+            mask = np.isin(hersteller.cat.codes.to_numpy(), selected[selected >= 0])
+        else:
+            mask = hersteller.isin(manufacturers)
+        df = df[mask]
+    return df
+
+# Function to turn the manufacturer selection into a hashable cache key
+def manufacturer_key(selected_manufacturers):
+    """Sorted tuple of selected manufacturers (empty when no filter is set)"""
+    return tuple(sorted(selected_manufacturers or ()))
+
+# Function to load a sheet restricted to the selected manufacturers
+@lru_cache(maxsize=64)
+def get_filtered_data(sheet_name, manufacturers):
+    """Filtered sheet shared by all callbacks (cached; must not be mutated)"""
+    return filter_by_manufacturers(SHEETS.get(sheet_name, pd.DataFrame()), manufacturers)
+
+# Function to count aircraft per group for the bar chart
+@cache.memoize(make_name=versioned)
+def get_group_counts(sheet_name, group_col, manufacturers):
+    """Unsorted aircraft counts per group (cached, so Top-N changes only re-slice them)"""
+    counts = get_filtered_data(sheet_name, manufacturers)[group_col].value_counts(sort=False)
+    return counts[counts > 0]  # Drop unused categories
+
+# Function to estimate a Gaussian KDE on an evenly spaced grid
+def fft_kde(values, x_grid):
+    """Binned Gaussian KDE via FFT convolution, using Scott's bandwidth like gaussian_kde"""
+    n = len(values)
+    dx = x_grid[1] - x_grid[0]
+    bandwidth = np.std(values, ddof=1) * n ** (-1 / 5)
+
+    # Count the samples falling into the cell around each grid point
+    counts, _ = np.histogram(values, bins=len(x_grid), range=(x_grid[0] - dx / 2, x_grid[-1] + dx / 2))
+    if bandwidth <= 0:
+        return counts / (n * dx)
+
+    # Kernel beyond 4 bandwidths (or the grid itself) adds nothing visible
+    half_width = min(int(np.ceil(4 * bandwidth / dx)), len(x_grid))
+    offsets = np.arange(-half_width, half_width + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+
+    return np.clip(signal.fftconvolve(counts, kernel, mode='same'), 0, None) / n
+
+# Function to compute histogram bins and the KDE curve for the density plot
+@cache.memoize(make_name=versioned)
+def mass_distribution(sheet_name, manufacturers):
+    """Histogram bin edges and KDE of the mass column (cached per sheet and manufacturer filter)"""
+    df = get_filtered_data(sheet_name, manufacturers)
+    # The column is float32; bin in float64 so Plotly's start + n * size reaches the end
+    mass_data = df['höchstzulässige Abflugmasse (kg)'].dropna().to_numpy(np.float64)
+
+    # Fixed bins computed once, so the browser doesn't re-bin on every render
+    edges = np.histogram_bin_edges(mass_data, bins=50)
+
+    # Evaluate the KDE five times per bin, the middle point at each bin center
+    grid_edges = np.linspace(edges[0], edges[-1], 5 * (len(edges) - 1) + 1)
+    x_range = 0.5 * (grid_edges[:-1] + grid_edges[1:])
+    return edges, x_range, fft_kde(mass_data, x_range)
+
+# Function to compute the summary card values
+def compute_summary_stats(df):
+    """Compute total count, unique manufacturers and mass statistics"""
+    mass_col = 'höchstzulässige Abflugmasse (kg)'
+    has_mass = mass_col in df.columns and not df[mass_col].isna().all()
+
+    return {
+        'total': len(df),
+        'manufacturers': int(df['Hersteller'].nunique()) if 'Hersteller' in df.columns else None,
+        'mass_mean': float(df[mass_col].mean()) if has_mass else None,
+        'mass_max': float(df[mass_col].max()) if has_mass else None
+    }
+
+# Function to precompute per-sheet aggregations for the sheet-agg-store
+def compute_sheet_aggregates(df):
+    """Compute value counts for every grouping plus summary stats (JSON-serializable)"""
+    value_counts = {}
+    for col in ['Hersteller', 'Herstellerbezeichnung', 'Group']:
+        if col in df.columns:
+            counts = df[col].value_counts()
+            counts = counts[counts > 0]  # Drop unused categories
+            # Stored as [name, count] pairs to keep the descending order in JSON
+            value_counts[col] = [[name, int(count)] for name, count in counts.items()]
+
+    return {'vc': value_counts, 'stats': compute_summary_stats(df)}
+
 # App layout
 app.layout = dbc.Container([
+    # Per-sheet aggregations, recomputed only when the sheet changes
+    dcc.Store(id='sheet-agg-store'),
+
     dbc.Row([
         dbc.Col([
             html.H1("🛩️ Aircraft Data Dashboard", className="text-center mb-4 mt-4"),
@@ -164,67 +361,89 @@ app.layout = dbc.Container([
 ], fluid=True, style={'backgroundColor': '#f8f9fa', 'minHeight': '100vh', 'paddingBottom': '50px'})
 
 
+@lru_cache(maxsize=32)
+def get_manufacturer_options(sheet_name):
+    """Build manufacturer dropdown options for a sheet (cached per sheet)"""
+    df = SHEETS.get(sheet_name, pd.DataFrame())
+
+    if df.empty or 'Hersteller' not in df.columns:
+        return []
+
+    # Count aircraft per manufacturer in a single pass, sorted by name
+    counts = df['Hersteller'].value_counts(sort=False).sort_index()
+    counts = counts[counts > 0]  # Drop unused categories
+
+    # Create options with manufacturer name and count
+    options = [
+        {'label': f'{manufacturer} ({count} aircraft)', 'value': manufacturer}
+        for manufacturer, count in counts.items()
+    ]
+
+    return options
+
+
 @callback(
     Output('manufacturer-filter', 'options'),
     Input('sheet-selector', 'value')
 )
 def update_manufacturer_options(selected_sheet):
     """Update manufacturer dropdown options based on selected sheet"""
+    return get_manufacturer_options(selected_sheet)
+
+
+@callback(
+    Output('sheet-agg-store', 'data'),
+    Input('sheet-selector', 'value')
+)
+def update_sheet_aggregates(selected_sheet):
+    """Precompute value counts and summary stats for the selected sheet"""
     df = load_sheet_data(selected_sheet)
 
-    if df.empty or 'Hersteller' not in df.columns:
-        return []
+    if df.empty:
+        return None
 
-    # Get unique manufacturers and sort them
-    manufacturers = sorted(df['Hersteller'].dropna().unique())
+    return compute_sheet_aggregates(df)
 
-    # Create options with manufacturer name and count
-    options = []
-    for manufacturer in manufacturers:
-        count = len(df[df['Hersteller'] == manufacturer])
-        options.append({
-            'label': f'{manufacturer} ({count} aircraft)',
-            'value': manufacturer
-        })
 
-    return options
+# Function to build a placeholder figure
+def empty_figure(text):
+    """Create an empty figure with a centered message (as a plain dict)"""
+    fig = go.Figure()
+    fig.add_annotation(text=text, showarrow=False)
+    return fig.to_dict()
+
+
+# Function to describe why there is nothing to show
+def no_data_message(selected_manufacturers):
+    """Message shown when the (filtered) sheet has no rows"""
+    if selected_manufacturers:
+        return "No data available for selected manufacturer(s)"
+    return "No data available"
 
 
 @callback(
     Output('bar-chart', 'figure'),
-    Output('density-plot', 'figure'),
-    Output('data-summary', 'children'),
-    Output('data-table', 'children'),
-    Input('sheet-selector', 'value'),
+    Input('sheet-agg-store', 'data'),
     Input('group-by-selector', 'value'),
     Input('top-n-slider', 'value'),
-    Input('manufacturer-filter', 'value')
+    Input('manufacturer-filter', 'value'),
+    State('sheet-selector', 'value')
 )
-def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
-    """Update all dashboard components based on selections"""
-
-    # Load data
-    df = load_sheet_data(selected_sheet)
+def update_bar(sheet_agg, group_by, top_n, selected_manufacturers, selected_sheet):
+    """Update the bar chart of aircraft counts per group"""
+    mfg_key = manufacturer_key(selected_manufacturers)
+    df = get_filtered_data(selected_sheet, mfg_key)
 
     if df.empty:
-        empty_fig = go.Figure()
-        empty_fig.add_annotation(text="No data available", showarrow=False)
-        return empty_fig, empty_fig, "No data available", ""
+        return empty_figure(no_data_message(mfg_key))
 
-    # Apply manufacturer filter if selected
-    if selected_manufacturers and len(selected_manufacturers) > 0 and 'Hersteller' in df.columns:
-        df = df[df['Hersteller'].isin(selected_manufacturers)]
-
-        if df.empty:
-            empty_fig = go.Figure()
-            empty_fig.add_annotation(text="No data available for selected manufacturer(s)", showarrow=False)
-            return empty_fig, empty_fig, "No data available for selected manufacturer(s)", ""
+    # Precomputed aggregates describe the whole sheet, so they only apply unfiltered
+    aggregates = sheet_agg if not mfg_key else None
 
     # Prepare grouping
     if group_by == 'both':
-        # Group by both columns
-        if 'Hersteller' in df.columns and 'Herstellerbezeichnung' in df.columns:
-            df['Group'] = df['Hersteller'].astype(str) + ' - ' + df['Herstellerbezeichnung'].astype(str)
+        # Group by both columns (precomputed at load time)
+        if 'Group' in df.columns:
             group_col = 'Group'
         else:
             group_col = 'Hersteller' if 'Hersteller' in df.columns else df.columns[0]
@@ -232,7 +451,12 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
         group_col = group_by if group_by in df.columns else df.columns[0]
 
     # Create bar chart
-    group_counts = df[group_col].value_counts().head(top_n)
+    if aggregates and group_col in aggregates['vc']:
+        pairs = aggregates['vc'][group_col]
+        group_counts = pd.Series([count for _, count in pairs],
+                                 index=[name for name, _ in pairs]).head(top_n)
+    else:
+        group_counts = get_group_counts(selected_sheet, group_col, mfg_key).nlargest(top_n)
     bar_data = pd.DataFrame({
         'Group': group_counts.index,
         'Count': group_counts.values
@@ -249,64 +473,100 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
         yaxis={'categoryorder': 'total ascending'},
         height=500,
         showlegend=False,
-        hovermode='closest'
+        hovermode='closest',
+        uirevision='bar'  # Keep zoom/pan while the data updates in place
     )
     bar_fig.update_traces(marker_color='rgb(55, 83, 109)')
 
+    # A plain dict is cheaper for Dash to serialize than a Figure
+    return bar_fig.to_dict()
+
+
+@callback(
+    Output('density-plot', 'figure'),
+    Input('sheet-selector', 'value'),
+    Input('manufacturer-filter', 'value')
+)
+def update_density(selected_sheet, selected_manufacturers):
+    """Update the mass distribution histogram and KDE curve"""
+    mfg_key = manufacturer_key(selected_manufacturers)
+    df = get_filtered_data(selected_sheet, mfg_key)
+
+    if df.empty:
+        return empty_figure(no_data_message(mfg_key))
+
     # Create density plot
     mass_col = 'höchstzulässige Abflugmasse (kg)'
-    if mass_col in df.columns:
-        mass_data = df[mass_col].dropna()
-
-        if len(mass_data) >= 2:
-            density_fig = go.Figure()
-
-            # Add histogram
-            density_fig.add_trace(go.Histogram(
-                x=mass_data,
-                name='Distribution',
-                nbinsx=50,
-                marker_color='rgba(55, 83, 109, 0.7)',
-                yaxis='y',
-                histnorm='probability density'
-            ))
-
-            # Add KDE (kernel density estimation) using Plotly
-            from scipy import stats
-            import numpy as np
-
-            kde = stats.gaussian_kde(mass_data)
-            x_range = np.linspace(mass_data.min(), mass_data.max(), 200)
-            density = kde(x_range)
-
-            density_fig.add_trace(go.Scatter(
-                x=x_range,
-                y=density,
-                mode='lines',
-                name='Density',
-                line=dict(color='rgb(219, 64, 82)', width=2),
-                yaxis='y2'
-            ))
-
-            density_fig.update_layout(
-                title=f'Distribution of {mass_col}',
-                xaxis_title=mass_col,
-                yaxis_title='Probability Density',
-                yaxis2=dict(
-                    title='Density (KDE)',
-                    overlaying='y',
-                    side='right'
-                ),
-                height=500,
-                showlegend=True,
-                hovermode='x unified'
-            )
-        else:
-            density_fig = go.Figure()
-            density_fig.add_annotation(text="No mass data available", showarrow=False)
+    if mass_col not in df.columns:
+        return empty_figure("Mass column not found")
+
+    mass_data = df[mass_col].dropna()
+    if len(mass_data) < 2:
+        return empty_figure("No mass data available")
+
+    edges, x_range, density = mass_distribution(selected_sheet, mfg_key)
+
+    density_fig = go.Figure()
+
+    # Add histogram
+    density_fig.add_trace(go.Histogram(
+        x=mass_data,
+        name='Distribution',
+        xbins=dict(start=float(edges[0]), end=float(edges[-1]),
+                   size=float(edges[-1] - edges[0]) / (len(edges) - 1)),
+        autobinx=False,
+        marker_color='rgba(55, 83, 109, 0.7)',
+        yaxis='y',
+        histnorm='probability density'
+    ))
+
+    # Add KDE (kernel density estimation) using Plotly
+    density_fig.add_trace(go.Scatter(
+        x=x_range,
+        y=density,
+        mode='lines',
+        name='Density',
+        line=dict(color='rgb(219, 64, 82)', width=2),
+        yaxis='y2'
+    ))
+
+    density_fig.update_layout(
+        title=f'Distribution of {mass_col}',
+        xaxis_title=mass_col,
+        yaxis_title='Probability Density',
+        yaxis2=dict(
+            title='Density (KDE)',
+            overlaying='y',
+            side='right'
+        ),
+        height=500,
+        showlegend=True,
+        hovermode='x unified',
+        # Reset zoom/pan only when the plotted data changes
+        uirevision=f"density-{selected_sheet}-{'|'.join(map(str, mfg_key))}"
+    )
+
+    return density_fig.to_dict()
+
+
+@callback(
+    Output('data-summary', 'children'),
+    Input('sheet-agg-store', 'data'),
+    Input('manufacturer-filter', 'value'),
+    State('sheet-selector', 'value')
+)
+def update_summary(sheet_agg, selected_manufacturers, selected_sheet):
+    """Update the summary statistic cards"""
+    mfg_key = manufacturer_key(selected_manufacturers)
+
+    # Precomputed stats describe the whole sheet, so they only apply unfiltered
+    if sheet_agg and not mfg_key:
+        summary = sheet_agg['stats']
     else:
-        density_fig = go.Figure()
-        density_fig.add_annotation(text="Mass column not found", showarrow=False)
+        df = get_filtered_data(selected_sheet, mfg_key)
+        if df.empty:
+            return no_data_message(mfg_key)
+        summary = compute_summary_stats(df)
 
     # Create summary statistics
     summary_cards = dbc.Row([
@@ -314,7 +574,7 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Total Aircraft", className="card-title"),
-                    html.H3(f"{len(df):,}", className="text-primary")
+                    html.H3(f"{summary['total']:,}", className="text-primary")
                 ])
             ])
         ], md=3),
@@ -323,7 +583,7 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Unique Manufacturers", className="card-title"),
-                    html.H3(f"{df['Hersteller'].nunique() if 'Hersteller' in df.columns else 'N/A'}",
+                    html.H3(f"{summary['manufacturers'] if summary['manufacturers'] is not None else 'N/A'}",
                            className="text-success")
                 ])
             ])
@@ -333,7 +593,7 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Average Mass (kg)", className="card-title"),
-                    html.H3(f"{df[mass_col].mean():,.0f}" if mass_col in df.columns and not df[mass_col].isna().all() else "N/A",
+                    html.H3(f"{summary['mass_mean']:,.0f}" if summary['mass_mean'] is not None else "N/A",
                            className="text-info")
                 ])
             ])
@@ -343,22 +603,39 @@ def update_dashboard(selected_sheet, group_by, top_n, selected_manufacturers):
             dbc.Card([
                 dbc.CardBody([
                     html.H5("Max Mass (kg)", className="card-title"),
-                    html.H3(f"{df[mass_col].max():,.0f}" if mass_col in df.columns and not df[mass_col].isna().all() else "N/A",
+                    html.H3(f"{summary['mass_max']:,.0f}" if summary['mass_max'] is not None else "N/A",
                            className="text-warning")
                 ])
             ])
         ], md=3),
     ])
 
-    # Create data table preview
-    table_data = df.head(10).to_html(classes='table table-striped table-hover', index=False)
+    return summary_cards
+
+
+@callback(
+    Output('data-table', 'children'),
+    Input('sheet-selector', 'value'),
+    Input('manufacturer-filter', 'value')
+)
+def update_table(selected_sheet, selected_manufacturers):
+    """Update the sample data preview"""
+    mfg_key = manufacturer_key(selected_manufacturers)
+    df = filter_by_manufacturers(load_preview_data(selected_sheet), mfg_key)
 
-    return bar_fig, density_fig, summary_cards, html.Div([html.Div(className="table-responsive",
-                                                                     children=html.Iframe(srcDoc=table_data,
-                                                                                         style={'width': '100%',
-                                                                                                'height': '400px',
-                                                                                                'border': 'none'}))])
+    if df.empty:
+        return ""
 
+    # Create data table preview
+    preview = df.head(10)
+
+    return dash_table.DataTable(
+        data=preview.to_dict('records'),
+        columns=[{'name': col, 'id': col} for col in preview.columns],
+        page_size=10,
+        style_table={'overflowX': 'auto'},
+        style_cell={'textAlign': 'left'}
+    )
 
 if __name__ == '__main__':
     print("Starting Aircraft Data Dashboard...")